@@ -0,0 +1,8 @@
+"""Expected values shared across the test modules."""
+
+NO_BODY_MESSAGE = "No data supplied in request body."
+INVALID_JSON_MESSAGE = "Request body is not valid JSON."
+INVALID_EVAL_MESSAGE = "Failed to validate body against the evaluation schema."
+INVALID_PREVIEW_MESSAGE = "Failed to validate body against the preview schema."
+
+OCTET_STREAM_HEADERS = {"Content-Type": "application/octet-stream"}
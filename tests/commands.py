@@ -1,8 +1,19 @@
 import unittest
 from typing import Any
+from unittest import mock
 
 from ..tools import commands, parse, validate
 from ..tools.utils import JsonType
+from ._fixtures import (
+    INVALID_EVAL_MESSAGE,
+    INVALID_PREVIEW_MESSAGE,
+    NO_BODY_MESSAGE,
+)
+
+FEEDBACK_HELLO = "should be 'hello'."
+FEEDBACK_YES = "should be 'yes'."
+FEEDBACK_NO = "should be 'no'."
+FEEDBACK_OTHER = "should be 'other'."
 
 
 def evaluation_function(
@@ -16,22 +27,33 @@ def evaluation_function(
     return {"is_correct": (response == answer) or force_true}
 
 
-class TestCommandsModule(unittest.TestCase):
-    def __init__(self, methodName: str = "runTest") -> None:
-        super().__init__(methodName)
+def make_event(response: Any, answer: Any, **params: Any) -> JsonType:
+    """Build an eval event, only spelling out the fields that vary."""
+    return {"body": {"response": response, "answer": answer, "params": params}}
 
-    def setUp(self) -> None:
+
+class TestCommandsModule(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
         commands.evaluation_function = evaluation_function
-        return super().setUp()
 
-    def tearDown(self) -> None:
+    @classmethod
+    def tearDownClass(cls) -> None:
         commands.evaluation_function = None
-        return super().tearDown()
+
+    def setUp(self) -> None:
+        # Cached results would otherwise carry over between tests.
+        self.addCleanup(commands._case_cache.clear)
+        commands._case_cache.clear()
+
+    def patch_commands(self, name: str, value: Any) -> None:
+        """Override an attribute of the commands module for a single test."""
+        patcher = mock.patch.object(commands, name, value)
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     def test_valid_eval_command(self):
-        event = {
-            "body": {"response": "hello", "answer": "world", "params": {}}
-        }
+        event = make_event("hello", "world")
         response = commands.evaluate(event)
 
         self.assertIn("result", response)
@@ -43,9 +65,7 @@ class TestCommandsModule(unittest.TestCase):
         with self.assertRaises(parse.ParseError) as e:
             commands.evaluate(event)
 
-        self.assertEqual(
-            e.exception.message, "No data supplied in request body."
-        )
+        self.assertEqual(e.exception.message, NO_BODY_MESSAGE)
 
     def test_invalid_eval_schema_raises_validation_error(self):
         event = {"body": {"response": "hello", "params": {}}}
@@ -53,27 +73,20 @@ class TestCommandsModule(unittest.TestCase):
         with self.assertRaises(validate.ValidationError) as e:
             commands.evaluate(event)
 
-        self.assertEqual(
-            e.exception.message,
-            "Failed to validate body against the evaluation schema.",
-        )
+        self.assertEqual(e.exception.message, INVALID_EVAL_MESSAGE)
 
     def test_single_feedback_case(self):
-        event = {
-            "body": {
-                "response": "hello",
-                "answer": "hello",
-                "params": {
-                    "cases": [
-                        {
-                            "answer": "other",
-                            "feedback": "should be 'other'.",
-                            "mark": 0,
-                        }
-                    ]
-                },
-            }
-        }
+        event = make_event(
+            "hello",
+            "hello",
+            cases=[
+                {
+                    "answer": "other",
+                    "feedback": FEEDBACK_OTHER,
+                    "mark": 0,
+                }
+            ],
+        )
 
         response = commands.evaluate(event)
         result = response["result"]  # type: ignore
@@ -83,48 +96,47 @@ class TestCommandsModule(unittest.TestCase):
         self.assertNotIn("feedback", result)
 
     def test_single_feedback_case_match(self):
-        event = {
-            "body": {
-                "response": "hello",
-                "answer": "world",
-                "params": {
-                    "cases": [
-                        {
-                            "answer": "hello",
-                            "feedback": "should be 'hello'.",
-                        }
-                    ]
-                },
-            }
-        }
+        event = make_event(
+            "hello",
+            "world",
+            cases=[{"answer": "hello", "feedback": FEEDBACK_HELLO}],
+        )
 
         response = commands.evaluate(event)
         result = response["result"]  # type: ignore
 
         self.assertFalse(result["is_correct"])
         self.assertEqual(result["matched_case"], 0)
-        self.assertEqual(result["feedback"], "should be 'hello'.")
+        self.assertEqual(result["feedback"], FEEDBACK_HELLO)
+
+    def test_falsy_is_correct_applies_case_feedback(self):
+        def falsy_function(response, answer, params):
+            return {"is_correct": 0 if response != answer else 1}
+
+        self.patch_commands("evaluation_function", falsy_function)
+
+        event = make_event(
+            "hello",
+            "world",
+            cases=[{"answer": "hello", "feedback": FEEDBACK_HELLO}],
+        )
+
+        response = commands.evaluate(event)
+        result = response["result"]  # type: ignore
+
+        self.assertEqual(result["matched_case"], 0)
+        self.assertEqual(result["feedback"], FEEDBACK_HELLO)
 
     def test_case_warning_data_structure(self):
-        event = {
-            "body": {
-                "response": "hello",
-                "answer": "world",
-                "params": {
-                    "cases": [
-                        {
-                            "feedback": "should be 'hello'.",
-                        }
-                    ]
-                },
-            }
-        }
+        event = make_event(
+            "hello", "world", cases=[{"feedback": FEEDBACK_HELLO}]
+        )
 
         response = commands.evaluate(event)
         result = response["result"]  # type: ignore
 
         self.assertIn("warnings", result)
-        warning = result["warnings"].pop()  # type: ignore
+        warning = result["warnings"][-1]  # type: ignore
 
         self.assertDictEqual(
             warning,
@@ -132,85 +144,77 @@ class TestCommandsModule(unittest.TestCase):
         )
 
     def test_multiple_feedback_cases_single_match(self):
-        event = {
-            "body": {
-                "response": "yes",
-                "answer": "world",
-                "params": {
-                    "cases": [
-                        {
-                            "answer": "hello",
-                            "feedback": "should be 'hello'.",
-                        },
-                        {
-                            "answer": "yes",
-                            "feedback": "should be 'yes'.",
-                        },
-                        {
-                            "answer": "no",
-                            "feedback": "should be 'no'.",
-                        },
-                    ]
-                },
-            }
-        }
+        event = make_event(
+            "yes",
+            "world",
+            cases=[
+                {"answer": "hello", "feedback": FEEDBACK_HELLO},
+                {"answer": "yes", "feedback": FEEDBACK_YES},
+                {"answer": "no", "feedback": FEEDBACK_NO},
+            ],
+        )
 
         response = commands.evaluate(event)
         result = response["result"]  # type: ignore
 
         self.assertFalse(result["is_correct"])
         self.assertEqual(result["matched_case"], 1)
-        self.assertEqual(result["feedback"], "should be 'yes'.")
+        self.assertEqual(result["feedback"], FEEDBACK_YES)
 
     def test_multiple_feedback_cases_multiple_matches(self):
-        event = {
-            "body": {
-                "response": "yes",
-                "answer": "world",
-                "params": {
-                    "cases": [
-                        {
-                            "answer": "hello",
-                            "feedback": "should be 'hello'.",
-                            "params": {"force": True},
-                        },
-                        {
-                            "answer": "yes",
-                            "feedback": "should be 'yes'.",
-                        },
-                        {
-                            "answer": "no",
-                            "feedback": "should be 'no'.",
-                        },
-                    ]
+        event = make_event(
+            "yes",
+            "world",
+            cases=[
+                {
+                    "answer": "hello",
+                    "feedback": FEEDBACK_HELLO,
+                    "params": {"force": True},
                 },
-            }
-        }
+                {"answer": "yes", "feedback": FEEDBACK_YES},
+                {"answer": "no", "feedback": FEEDBACK_NO},
+            ],
+        )
 
         response = commands.evaluate(event)
         result = response["result"]  # type: ignore
 
         self.assertFalse(result["is_correct"])
         self.assertEqual(result["matched_case"], 0)
-        self.assertEqual(result["feedback"], "should be 'hello'.")
+        self.assertEqual(result["feedback"], FEEDBACK_HELLO)
+
+    def test_null_case_params_are_ignored(self):
+        event = make_event(
+            "hello",
+            "world",
+            cases=[
+                {
+                    "answer": "hello",
+                    "feedback": FEEDBACK_HELLO,
+                    "params": None,
+                }
+            ],
+        )
+
+        response = commands.evaluate(event)
+        result = response["result"]  # type: ignore
+
+        self.assertEqual(result["matched_case"], 0)
+        self.assertEqual(result["feedback"], FEEDBACK_HELLO)
 
     def test_case_params_overwrite_eval_params(self):
-        event = {
-            "body": {
-                "response": "hello",
-                "answer": "world",
-                "params": {
-                    "force": True,
-                    "cases": [
-                        {
-                            "answer": "yes",
-                            "feedback": "should be 'yes'.",
-                            "params": {"force": False},
-                        }
-                    ],
-                },
-            }
-        }
+        event = make_event(
+            "hello",
+            "world",
+            force=True,
+            cases=[
+                {
+                    "answer": "yes",
+                    "feedback": FEEDBACK_YES,
+                    "params": {"force": False},
+                }
+            ],
+        )
 
         response = commands.evaluate(event)
         result = response["result"]  # type: ignore
@@ -220,27 +224,23 @@ class TestCommandsModule(unittest.TestCase):
         self.assertNotIn("feedback", result)
 
     def test_invalid_case_entry_doesnt_raise_exception(self):
-        event = {
-            "body": {
-                "response": "hello",
-                "answer": "world",
-                "params": {
-                    "cases": [
-                        {
-                            "answer": "hello",
-                            "feedback": "should be 'hello'.",
-                            "params": {"raise": True},
-                        }
-                    ]
-                },
-            }
-        }
+        event = make_event(
+            "hello",
+            "world",
+            cases=[
+                {
+                    "answer": "hello",
+                    "feedback": FEEDBACK_HELLO,
+                    "params": {"raise": True},
+                }
+            ],
+        )
 
         response = commands.evaluate(event)
         result = response["result"]  # type: ignore
 
         self.assertIn("warnings", result)
-        warning = result["warnings"].pop()  # type: ignore
+        warning = result["warnings"][-1]  # type: ignore
 
         self.assertDictEqual(
             warning,
@@ -253,35 +253,26 @@ class TestCommandsModule(unittest.TestCase):
         )
 
     def test_multiple_matched_cases_are_combined_and_warned(self):
-        event = {
-            "body": {
-                "response": "yes",
-                "answer": "world",
-                "params": {
-                    "cases": [
-                        {
-                            "answer": "hello",
-                            "feedback": "should be 'hello'.",
-                            "params": {"force": True},
-                        },
-                        {
-                            "answer": "yes",
-                            "feedback": "should be 'yes'.",
-                        },
-                        {
-                            "answer": "no",
-                            "feedback": "should be 'no'.",
-                        },
-                    ]
+        event = make_event(
+            "yes",
+            "world",
+            return_first_match=False,
+            cases=[
+                {
+                    "answer": "hello",
+                    "feedback": FEEDBACK_HELLO,
+                    "params": {"force": True},
                 },
-            }
-        }
+                {"answer": "yes", "feedback": FEEDBACK_YES},
+                {"answer": "no", "feedback": FEEDBACK_NO},
+            ],
+        )
 
         response = commands.evaluate(event)
         result = response["result"]  # type: ignore
 
         self.assertIn("warnings", result)
-        warning = result["warnings"].pop()  # type: ignore
+        warning = result["warnings"][-1]  # type: ignore
 
         self.assertDictEqual(
             warning,
@@ -292,52 +283,209 @@ class TestCommandsModule(unittest.TestCase):
         )
 
     def test_overriding_eval_feedback_to_correct_case(self):
-        event = {
-            "body": {
-                "response": "hello",
-                "answer": "world",
-                "params": {
-                    "cases": [
-                        {
-                            "answer": "hello",
-                            "feedback": "should be 'hello'.",
-                            "mark": 1,
-                        }
-                    ]
-                },
-            }
-        }
+        event = make_event(
+            "hello",
+            "world",
+            cases=[
+                {
+                    "answer": "hello",
+                    "feedback": FEEDBACK_HELLO,
+                    "mark": 1,
+                }
+            ],
+        )
 
         response = commands.evaluate(event)
         result = response["result"]  # type: ignore
 
         self.assertTrue(result["is_correct"])
         self.assertEqual(result["matched_case"], 0)
-        self.assertEqual(result["feedback"], "should be 'hello'.")
+        self.assertEqual(result["feedback"], FEEDBACK_HELLO)
 
     def test_overriding_eval_feedback_to_incorrect_case(self):
-        event = {
-            "body": {
-                "response": "hello",
-                "answer": "hello",
-                "params": {
-                    "cases": [
-                        {
-                            "answer": "hello",
-                            "feedback": "should be 'hello'.",
-                            "mark": 0,
-                        }
-                    ]
-                },
-            }
-        }
+        event = make_event(
+            "hello",
+            "hello",
+            cases=[
+                {
+                    "answer": "hello",
+                    "feedback": FEEDBACK_HELLO,
+                    "mark": 0,
+                }
+            ],
+        )
 
         response = commands.evaluate(event)
         result = response["result"]  # type: ignore
 
         self.assertFalse(result["is_correct"])
         self.assertEqual(result["matched_case"], 0)
-        self.assertEqual(result["feedback"], "should be 'hello'.")
+        self.assertEqual(result["feedback"], FEEDBACK_HELLO)
+
+    def test_repeated_cases_are_cached(self):
+        calls = []
+
+        def counting_function(response, answer, params):
+            calls.append(answer)
+            return evaluation_function(response, answer, params)
+
+        self.patch_commands("evaluation_function", counting_function)
+
+        event = make_event(
+            "hello",
+            "world",
+            cases=[{"answer": "other", "feedback": FEEDBACK_OTHER}],
+        )
+
+        commands.evaluate(event)
+        commands.evaluate(event)
+
+        self.assertEqual(calls, ["world", "other"])
+
+    def test_case_matching_task_answer_reuses_result(self):
+        calls = []
+
+        def counting_function(response, answer, params):
+            calls.append(answer)
+            return evaluation_function(response, answer, params)
+
+        self.patch_commands("evaluation_function", counting_function)
+
+        event = make_event(
+            "hello",
+            "world",
+            cases=[{"answer": "world", "feedback": "should be 'world'."}],
+        )
+
+        commands.evaluate(event)
+
+        self.assertEqual(calls, ["world"])
+
+    def test_cached_results_are_copied(self):
+        def nested_function(response, answer, params):
+            return {"is_correct": False, "feedback": ["original"]}
+
+        self.patch_commands("evaluation_function", nested_function)
+
+        first = commands.cached_evaluation("hello", "world", {})
+        first["feedback"].append("mutated")
+
+        second = commands.cached_evaluation("hello", "world", {})
+        self.assertEqual(second["feedback"], ["original"])
+
+    def test_skip_evaluation_cache(self):
+        calls = []
+
+        def counting_function(response, answer, params):
+            calls.append(answer)
+            return evaluation_function(response, answer, params)
+
+        self.patch_commands("evaluation_function", counting_function)
+        self.patch_commands("SKIP_EVALUATION_CACHE", True)
+
+        commands.cached_evaluation("hello", "world", {})
+        commands.cached_evaluation("hello", "world", {})
+
+        self.assertEqual(calls, ["world", "world"])
+        self.assertEqual(len(commands._case_cache), 0)
+
+    def test_cases_are_left_out_of_the_cache_key(self):
+        cases = [{"answer": "other", "feedback": FEEDBACK_OTHER}]
+        commands.evaluate(make_event("hello", "world", cases=cases))
+
+        self.assertEqual(len(commands._case_cache), 2)
+
+        for _, key in commands._case_cache:
+            self.assertNotIn(FEEDBACK_OTHER, key)
+
+    def test_batch_evaluation_function(self):
+        batches = []
+
+        def evaluation_function_batch(response, batch):
+            batches.append(batch)
+            return [evaluation_function(response, a, p) for a, p in batch]
+
+        self.patch_commands(
+            "evaluation_function_batch", evaluation_function_batch
+        )
+
+        event = make_event(
+            "yes",
+            "world",
+            cases=[
+                {"answer": "hello", "feedback": FEEDBACK_HELLO},
+                {"feedback": "missing answer."},
+                {"answer": "yes", "feedback": FEEDBACK_YES},
+            ],
+        )
+
+        response = commands.evaluate(event)
+        result = response["result"]  # type: ignore
+
+        self.assertEqual(len(batches), 1)
+        answers = [answer for answer, _ in batches[0]]
+
+        self.assertEqual(answers, ["hello", "yes"])
+        self.assertEqual(result["matched_case"], 2)
+        self.assertEqual(result["feedback"], FEEDBACK_YES)
+        self.assertEqual(
+            result["warnings"],
+            [{"case": 1, "message": "Missing answer/feedback field"}],
+        )
+
+    def test_batch_evaluation_function_malformed_result(self):
+        def evaluation_function_batch(response, batch):
+            return [{"feedback": "no is_correct."}, {"is_correct": True}]
+
+        self.patch_commands(
+            "evaluation_function_batch", evaluation_function_batch
+        )
+
+        event = make_event(
+            "yes",
+            "world",
+            cases=[
+                {"answer": "hello", "feedback": FEEDBACK_HELLO},
+                {"answer": "yes", "feedback": FEEDBACK_YES},
+            ],
+        )
+
+        response = commands.evaluate(event)
+        result = response["result"]  # type: ignore
+
+        self.assertEqual(result["matched_case"], 1)
+        self.assertEqual(result["feedback"], FEEDBACK_YES)
+
+        warning = result["warnings"][-1]
+        self.assertEqual(warning["case"], 0)
+        self.assertEqual(warning["detail"], "'is_correct'")
+
+    def test_batch_evaluation_function_short_result(self):
+        def evaluation_function_batch(response, batch):
+            return [{"is_correct": True}]
+
+        self.patch_commands(
+            "evaluation_function_batch", evaluation_function_batch
+        )
+
+        event = make_event(
+            "yes",
+            "world",
+            cases=[
+                {"answer": "hello", "feedback": FEEDBACK_HELLO},
+                {"answer": "yes", "feedback": FEEDBACK_YES},
+            ],
+        )
+
+        response = commands.evaluate(event)
+        result = response["result"]  # type: ignore
+
+        self.assertFalse(result["is_correct"])
+        self.assertNotIn("matched_case", result)
+        self.assertEqual(
+            result["warnings"][-1]["message"],
+            "The batch evaluation function returned 1 results for 2 cases.",
+        )
 
     def test_valid_preview_command(self):
         event = {"body": {"response": "hello"}}
@@ -353,9 +501,7 @@ class TestCommandsModule(unittest.TestCase):
         with self.assertRaises(parse.ParseError) as e:
             commands.preview(event)
 
-        self.assertEqual(
-            e.exception.message, "No data supplied in request body."
-        )
+        self.assertEqual(e.exception.message, NO_BODY_MESSAGE)
 
     def test_invalid_preview_schema_raises_validation_error(self):
         event = {"body": {"response": "hello", "answer": "hello"}}
@@ -363,10 +509,7 @@ class TestCommandsModule(unittest.TestCase):
         with self.assertRaises(validate.ValidationError) as e:
             commands.preview(event)
 
-        self.assertEqual(
-            e.exception.message,
-            "Failed to validate body against the preview schema.",
-        )
+        self.assertEqual(e.exception.message, INVALID_PREVIEW_MESSAGE)
 
     def test_healthcheck(self):
         response = commands.healthcheck()
@@ -1,30 +1,40 @@
 import base64
+import os
+import tempfile
 import unittest
 
 from ..tools import docs
+from ._fixtures import OCTET_STREAM_HEADERS
 
 
 class TestDocsModule(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.test_file_body = base64.b64encode(b"# Test file\n").decode("ascii")
+
+    def test_octet_stream_headers(self):
+        self.assertDictEqual(docs.OCTET_STREAM_HEADERS, OCTET_STREAM_HEADERS)
+
     def test_handling_available_doc(self):
         result = docs.send_file("tests/test_file.md")
 
         self.assertEqual(result["statusCode"], 200)
-        self.assertDictEqual(
-            result["headers"], {"Content-Type": "application/octet-stream"}
-        )
+        self.assertIs(result["headers"], docs.OCTET_STREAM_HEADERS)
         self.assertTrue(result["isBase64Encoded"])
 
-        self.assertEqual(
-            result["body"], base64.encodebytes(b"# Test file\n").decode()
-        )
+        self.assertEqual(result["body"], self.test_file_body)
+
+    def test_available_doc_is_cached(self):
+        first = docs.send_file("tests/test_file.md")
+        second = docs.send_file("tests/test_file.md")
+
+        self.assertIs(first, second)
 
     def test_handling_missing_doc(self):
         result = docs.send_file("tests/non-existent-doc.md")
 
         self.assertEqual(result["statusCode"], 200)
-        self.assertDictEqual(
-            result["headers"], {"Content-Type": "application/octet-stream"}
-        )
+        self.assertIs(result["headers"], docs.OCTET_STREAM_HEADERS)
         self.assertFalse(result["isBase64Encoded"])
 
         self.assertEqual(
@@ -43,9 +53,7 @@ class TestDocsModule(unittest.TestCase):
         result = docs.user()
 
         self.assertEqual(result["statusCode"], 200)
-        self.assertDictEqual(
-            result["headers"], {"Content-Type": "application/octet-stream"}
-        )
+        self.assertIs(result["headers"], docs.OCTET_STREAM_HEADERS)
         self.assertFalse(result["isBase64Encoded"])
 
         self.assertEqual(
@@ -57,9 +65,7 @@ class TestDocsModule(unittest.TestCase):
         result = docs.dev()
 
         self.assertEqual(result["statusCode"], 200)
-        self.assertDictEqual(
-            result["headers"], {"Content-Type": "application/octet-stream"}
-        )
+        self.assertIs(result["headers"], docs.OCTET_STREAM_HEADERS)
         self.assertFalse(result["isBase64Encoded"])
 
         self.assertEqual(
@@ -67,6 +73,48 @@ class TestDocsModule(unittest.TestCase):
             "app/docs/dev.md missing from evaluation function files",
         )
 
+    def test_available_docs_responses_are_cached(self):
+        cwd = os.getcwd()
+
+        with tempfile.TemporaryDirectory() as directory:
+            os.makedirs(os.path.join(directory, "app", "docs"))
+
+            for name in ("user.md", "dev.md"):
+                filepath = os.path.join(directory, "app", "docs", name)
+
+                with open(filepath, "wb") as file:
+                    file.write(b"# Docs\n")
+
+            os.chdir(directory)
+
+            try:
+                self.assertIs(docs.user(), docs.user())
+                self.assertIs(docs.dev(), docs.dev())
+            finally:
+                os.chdir(cwd)
+
+    def test_modified_doc_is_reencoded(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, "doc.md")
+
+            with open(filepath, "wb") as file:
+                file.write(b"# Old docs\n")
+
+            docs.send_file(filepath)
+
+            with open(filepath, "wb") as file:
+                file.write(b"# New docs\n")
+
+            # Make sure the modification time changes, however coarse.
+            mtime_ns = os.stat(filepath).st_mtime_ns + 1_000_000_000
+            os.utime(filepath, ns=(mtime_ns, mtime_ns))
+
+            result = docs.send_file(filepath)
+
+        self.assertEqual(
+            result["body"], base64.b64encode(b"# New docs\n").decode("ascii")
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
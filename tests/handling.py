@@ -1,48 +1,87 @@
+import sys
 import unittest
 from typing import Optional
+from unittest import mock
 
 from ..handler import handler
 from ..tools import commands
+from ..tools.validate import ResBodyValidators
 from ..tools.utils import EvaluationFunctionType
+from ._fixtures import (
+    INVALID_EVAL_MESSAGE,
+    INVALID_JSON_MESSAGE,
+    INVALID_PREVIEW_MESSAGE,
+    NO_BODY_MESSAGE,
+)
+
+# The package exports the handler function under the module's name.
+handler_module = sys.modules[handler.__module__]
 
 evaluation_function: Optional[
     EvaluationFunctionType
 ] = lambda response, answer, params: {"is_correct": True}
 
 
+# Events the handler should turn into an error response, with its message.
+BAD_EVENTS = (
+    (
+        "bodyless_event",
+        {"random": "metadata", "without": "a body"},
+        NO_BODY_MESSAGE,
+    ),
+    (
+        "non_json_body",
+        {"random": "metadata", "body": "{}}}{{{[][] this is not json."},
+        INVALID_JSON_MESSAGE,
+    ),
+    (
+        "invalid_command",
+        {
+            "random": "metadata",
+            "body": "{}",
+            "headers": {"command": "not a command"},
+        },
+        "Unknown command 'not a command'.",
+    ),
+    (
+        "bodyless_preview",
+        {"random": "metadata", "headers": {"command": "preview"}},
+        NO_BODY_MESSAGE,
+    ),
+    (
+        "invalid_eval_schema",
+        {"body": {"response": "hello", "params": {}}},
+        INVALID_EVAL_MESSAGE,
+    ),
+    (
+        "invalid_preview_schema",
+        {
+            "body": {"response": "hello", "answer": "hello"},
+            "headers": {"command": "preview"},
+        },
+        INVALID_PREVIEW_MESSAGE,
+    ),
+)
+
+
 class TestHandlerFunction(unittest.TestCase):
-    def setUp(self) -> None:
+    @classmethod
+    def setUpClass(cls) -> None:
         commands.evaluation_function = evaluation_function
-        return super().setUp()
 
-    def tearDown(self) -> None:
+    @classmethod
+    def tearDownClass(cls) -> None:
         commands.evaluation_function = None
-        return super().tearDown()
 
-    def test_handle_bodyless_event(self):
-        event = {"random": "metadata", "without": "a body"}
+    def test_bad_events_return_error(self):
+        for name, event, message in BAD_EVENTS:
+            with self.subTest(name):
+                response = handler(event)
 
-        response = handler(event)
+                self.assertIn("error", response)
+                error = response.get("error")
 
-        self.assertIn("error", response)
-        error = response.get("error")
-
-        self.assertEqual(
-            error["message"],  # type: ignore
-            "No data supplied in request body.",
-        )
-
-    def test_non_json_body(self):
-        event = {"random": "metadata", "body": "{}}}{{{[][] this is not json."}
-
-        response = handler(event)
-
-        self.assertIn("error", response)
-        error = response.get("error")
-
-        self.assertEqual(
-            error["message"], "Request body is not valid JSON."  # type: ignore
-        )
+                self.assertEqual(error["message"], message)  # type: ignore
 
     def test_eval(self):
         event = {
@@ -68,6 +107,18 @@ class TestHandlerFunction(unittest.TestCase):
         self.assertEqual(response.get("command"), "eval")
         self.assertIn("result", response)
 
+    def test_grade_is_eval_alias(self):
+        event = {
+            "random": "metadata",
+            "body": {"response": "hello", "answer": "world!"},
+            "headers": {"command": "grade"},
+        }
+
+        response = handler(event)
+
+        self.assertEqual(response.get("command"), "eval")
+        self.assertIn("result", response)
+
     def test_handler_evals_by_default(self):
         event = {
             "random": "metadata",
@@ -114,19 +165,33 @@ class TestHandlerFunction(unittest.TestCase):
         self.assertEqual(response.get("command"), "healthcheck")
         self.assertIn("result", response)
 
-    def test_invalid_command(self):
-        event = {
-            "random": "metadata",
-            "body": "{}",
-            "headers": {"command": "not a command"},
-        }
+    def test_skip_response_validation(self):
+        event = {"body": {"response": "hello", "answer": "world!"}}
+        malformed = lambda response, answer, params: {"is_correct": "yes"}
 
-        response = handler(event)
-        error = response.get("error")
+        with mock.patch.object(commands, "evaluation_function", malformed):
+            response = handler(event)
+            self.assertIn("error", response)
+
+            with mock.patch.object(
+                handler_module, "SKIP_RESPONSE_VALIDATION", True
+            ):
+                response = handler(event)
+
+        self.assertEqual(response.get("result"), {"is_correct": "yes"})
+
+    def test_skip_response_validation_still_validates_errors(self):
+        malformed = {"error": {"detail": "missing a message"}}
+        entry = (lambda _: malformed, ResBodyValidators.EVALUATION)
+
+        with mock.patch.object(
+            handler_module, "SKIP_RESPONSE_VALIDATION", True
+        ), mock.patch.dict(handler_module.COMMANDS, {"eval": entry}):
+            response = handler({"body": "{}"})
 
+        self.assertIsNot(response, malformed)
         self.assertEqual(
-            error["message"],  # type: ignore
-            "Unknown command 'not a command'.",
+            response["error"]["message"], INVALID_EVAL_MESSAGE  # type: ignore
         )
 
 
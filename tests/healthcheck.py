@@ -0,0 +1,32 @@
+import io
+import unittest
+
+from ..tools.healthcheck import HealthcheckResult
+
+# Test ids and the name reported for them in the healthcheck result.
+TEST_IDS = (
+    ("app.tests.smoke_tests.SmokeTests.test_load", "SmokeTests.test_load"),
+    (
+        "app/evaluation_tests.TestEvaluationFunction.test_x",
+        "TestEvaluationFunction.test_x",
+    ),
+    ("SmokeTests.test_load", "Unknown"),
+    ("setUpClass (app.tools.smoke_tests.SmokeTests)", "Unknown"),
+    ("setUpModule (app.evaluation_tests)", "Unknown"),
+    ("app.tests.Tests.test_x (sub=1)", "Unknown"),
+    ("foo bar.Class.method", "Unknown"),
+    ("x (y).Class.method", "Unknown"),
+)
+
+
+class TestHealthcheckModule(unittest.TestCase):
+    def test_get_name_from_id(self):
+        result = HealthcheckResult(io.StringIO(), True, 0)
+
+        for path, name in TEST_IDS:
+            with self.subTest(path):
+                self.assertEqual(result.get_name_from_id(path), name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,10 @@
+import json
 import unittest
+from collections import OrderedDict
+from unittest import mock
 
 from ..tools import parse
+from ._fixtures import INVALID_JSON_MESSAGE, NO_BODY_MESSAGE
 
 
 class TestParseModule(unittest.TestCase):
@@ -12,29 +16,38 @@ class TestParseModule(unittest.TestCase):
         result = parse.body({"body": {"hello": "world", "answer": 1}})
         self.assertDictEqual(result, {"hello": "world", "answer": 1})
 
+    def test_valid_dictionary_subclass(self):
+        body = OrderedDict(hello="world", answer=1)
+        result = parse.body({"body": body})
+        self.assertIs(result, body)
+
+    def test_valid_json_memoryview(self):
+        body = memoryview(b'{"hello": "world", "answer": 1}')
+
+        for loads in (parse.fast_loads, json.loads):
+            with self.subTest(loads.__module__):
+                with mock.patch.object(parse, "fast_loads", loads):
+                    result = parse.body({"body": body})
+
+                self.assertDictEqual(result, {"hello": "world", "answer": 1})
+
     def test_null_object_raises_parse_error(self):
         with self.assertRaises(parse.ParseError) as e:
             parse.body({"body": None})
 
-        self.assertEqual(
-            e.exception.message, "No data supplied in request body."
-        )
+        self.assertEqual(e.exception.message, NO_BODY_MESSAGE)
 
     def test_invalid_json_string_raises_parse_error(self):
         with self.assertRaises(parse.ParseError) as e:
             parse.body({"body": '{"hello": "world", "answer": 1} }'})
 
-        self.assertEqual(
-            e.exception.message, "Request body is not valid JSON."
-        )
+        self.assertEqual(e.exception.message, INVALID_JSON_MESSAGE)
 
     def test_decode_detail_data_structure(self):
         with self.assertRaises(parse.ParseError) as e:
             parse.body({"body": '{"hello": "world", "answer": 1} }'})
 
-        self.assertEqual(
-            e.exception.message, "Request body is not valid JSON."
-        )
+        self.assertEqual(e.exception.message, INVALID_JSON_MESSAGE)
 
         self.assertDictEqual(
             e.exception.error_thrown,  # type: ignore
@@ -43,13 +56,11 @@ class TestParseModule(unittest.TestCase):
 
     def test_generic_exception_returns_detail(self):
         with self.assertRaises(parse.ParseError) as e:
-            parse.body({"body": lambda x: x**2})
+            parse.body({"body": object()})
 
-        self.assertEqual(
-            e.exception.message, "Request body is not valid JSON."
-        )
+        self.assertEqual(e.exception.message, INVALID_JSON_MESSAGE)
 
         self.assertEqual(
             e.exception.error_thrown,
-            "the JSON object must be str, bytes or bytearray, not function",
+            "Expected a JSON string or object, got object.",
         )
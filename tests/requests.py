@@ -1,125 +1,218 @@
+import contextlib
+import os
+import tempfile
 import unittest
+from typing import Iterator
+from unittest import mock
+
+import jsonschema
 
 from ..tools import validate
-from ..tools.validate import ReqBodyValidators, ValidationError
+from ..tools.validate import (
+    ReqBodyValidators,
+    ResBodyValidators,
+    ValidationError,
+)
+from ._fixtures import INVALID_EVAL_MESSAGE
+
+# Request bodies that fail validation and the schema error they report.
+INVALID_BODIES = (
+    (
+        "missing_response",
+        {"answer": "example", "params": {}},
+        ReqBodyValidators.EVALUATION,
+        "'response' is a required property",
+    ),
+    (
+        "null_response_for_eval",
+        {"response": None, "answer": "example", "params": {}},
+        ReqBodyValidators.EVALUATION,
+        "None should not be valid under {'type': 'null'}",
+    ),
+    (
+        "null_response_for_preview",
+        {"response": None, "params": {}},
+        ReqBodyValidators.PREVIEW,
+        "None should not be valid under {'type': 'null'}",
+    ),
+    (
+        "missing_answer_in_eval",
+        {"response": "example", "params": {}},
+        ReqBodyValidators.EVALUATION,
+        "'answer' is a required property",
+    ),
+    (
+        "including_answer_in_preview",
+        {"response": "example", "answer": "anything", "params": {}},
+        ReqBodyValidators.PREVIEW,
+        "Additional properties are not allowed ('answer' was unexpected)",
+    ),
+    (
+        "null_answer",
+        {"response": "example", "answer": None, "params": {}},
+        ReqBodyValidators.EVALUATION,
+        "None should not be valid under {'type': 'null'}",
+    ),
+    (
+        "bad_params",
+        {"response": "example", "answer": "example", "params": 2},
+        ReqBodyValidators.EVALUATION,
+        "2 is not of type 'object'",
+    ),
+    (
+        "extra_fields",
+        {
+            "response": "example",
+            "answer": "example",
+            "params": {},
+            "hello": "world",
+        },
+        ReqBodyValidators.EVALUATION,
+        "Additional properties are not allowed ('hello' was unexpected)",
+    ),
+)
+
+# Request bodies that pass validation.
+VALID_BODIES = (
+    (
+        "missing_answer_in_preview",
+        {"response": "example", "params": {}},
+        ReqBodyValidators.PREVIEW,
+    ),
+    (
+        "including_answer_in_eval",
+        {"response": "example", "answer": "anything", "params": {}},
+        ReqBodyValidators.EVALUATION,
+    ),
+    (
+        "valid_request_body",
+        {"response": "", "answer": ""},
+        ReqBodyValidators.EVALUATION,
+    ),
+)
 
 
 class TestRequestValidation(unittest.TestCase):
-    def test_empty_request_body(self):
-        body = {}
-
-        with self.assertRaises(ValidationError) as e:
-            validate.body(body, ReqBodyValidators.EVALUATION)
-
-        self.assertEqual(
-            str(e.exception.message),
-            "Failed to validate body against the evaluation schema.",
+    @contextlib.contextmanager
+    def use_schema_dir(self, path: str) -> Iterator[None]:
+        """Load schemas from another directory, bypassing the caches."""
+        loaders = (
+            validate.load_schema,
+            validate.load_validator,
+            validate.load_fast_validator,
         )
 
-    def test_missing_response(self):
-        body = {"answer": "example", "params": {}}
+        for loader in loaders:
+            loader.cache_clear()
 
-        with self.assertRaises(ValidationError) as e:
-            validate.body(body, ReqBodyValidators.EVALUATION)
+        try:
+            with mock.patch.dict(os.environ, {"SCHEMA_DIR": path}):
+                yield
+        finally:
+            for loader in loaders:
+                loader.cache_clear()
 
-        self.assertEqual(
-            e.exception.error_thrown["message"],  # type: ignore
-            "'response' is a required property",
-        )
-
-    def test_null_response_for_eval(self):
-        body = {"response": None, "answer": "example", "params": {}}
-
-        with self.assertRaises(ValidationError) as e:
-            validate.body(body, ReqBodyValidators.EVALUATION)
-
-        self.assertEqual(
-            e.exception.error_thrown["message"],  # type: ignore
-            "None should not be valid under {'type': 'null'}",
-        )
-
-    def test_null_response_for_preview(self):
-        body = {"response": None, "params": {}}
-
-        with self.assertRaises(ValidationError) as e:
-            validate.body(body, ReqBodyValidators.PREVIEW)
-
-        self.assertEqual(
-            e.exception.error_thrown["message"],  # type: ignore
-            "None should not be valid under {'type': 'null'}",
-        )
-
-    def test_missing_answer_in_eval(self):
-        body = {"response": "example", "params": {}}
+    def test_empty_request_body(self):
+        body = {}
 
         with self.assertRaises(ValidationError) as e:
             validate.body(body, ReqBodyValidators.EVALUATION)
 
-        self.assertEqual(
-            e.exception.error_thrown["message"],  # type: ignore
-            "'answer' is a required property",
-        )
-
-    def test_missing_answer_in_preview(self):
-        body = {"response": "example", "params": {}}
-        validate.body(body, ReqBodyValidators.PREVIEW)
-
-    def test_including_answer_in_eval(self):
-        body = {"response": "example", "answer": "anything", "params": {}}
-        validate.body(body, ReqBodyValidators.EVALUATION)
-
-    def test_including_answer_in_preview(self):
-        body = {"response": "example", "answer": "anything", "params": {}}
-
-        with self.assertRaises(ValidationError) as e:
-            validate.body(body, ReqBodyValidators.PREVIEW)
-
-        self.assertEqual(
-            e.exception.error_thrown["message"],  # type: ignore
-            "Additional properties are not allowed ('answer' was unexpected)",
+        self.assertEqual(str(e.exception.message), INVALID_EVAL_MESSAGE)
+
+    def test_invalid_request_bodies(self):
+        for name, body, validator, message in INVALID_BODIES:
+            with self.subTest(name):
+                with self.assertRaises(ValidationError) as e:
+                    validate.body(body, validator)
+
+                self.assertEqual(
+                    e.exception.error_thrown["message"],  # type: ignore
+                    message,
+                )
+
+    def test_valid_request_bodies(self):
+        for name, body, validator in VALID_BODIES:
+            with self.subTest(name):
+                validate.body(body, validator)
+
+    @unittest.skipIf(validate.fastjsonschema is None, "Not installed.")
+    def test_fast_validator_agrees_with_jsonschema(self):
+        bodies = INVALID_BODIES + VALID_BODIES
+
+        for name, body, validator, *_ in bodies:
+            with self.subTest(name):
+                fast_validator = validate.load_fast_validator(validator)
+
+                try:
+                    fast_validator(body)  # type: ignore
+                    is_valid = True
+                except validate.fastjsonschema.JsonSchemaException:
+                    is_valid = False
+
+                schema_validator = validate.load_validator(validator)
+                self.assertEqual(is_valid, schema_validator.is_valid(body))
+
+    def test_schemas_are_valid(self):
+        validators = (*ReqBodyValidators, *ResBodyValidators)
+
+        for validator in validators:
+            with self.subTest(validator.name):
+                schema = validate.load_schema(validator)
+                jsonschema.Draft7Validator.check_schema(schema)
+
+    def test_schema_load_failure_raises_validation_error(self):
+        error = RuntimeError("No schema path suplied.")
+
+        with mock.patch.object(
+            validate, "load_fast_validator", side_effect=error
+        ):
+            with self.assertRaises(ValidationError) as e:
+                validate.body({}, ReqBodyValidators.EVALUATION)
+
+        self.assertEqual(e.exception.message, INVALID_EVAL_MESSAGE)
+        self.assertEqual(e.exception.error_thrown, "No schema path suplied.")
+
+    def test_malformed_schema_raises_validation_error(self):
+        schemas = (
+            ("not_an_object", "[]"),
+            ("unknown_type", '{"type": "unknown"}'),
         )
 
-    def test_null_answer(self):
-        body = {"response": "example", "answer": None, "params": {}}
-
-        with self.assertRaises(ValidationError) as e:
-            validate.body(body, ReqBodyValidators.EVALUATION)
+        for name, schema in schemas:
+            with self.subTest(name), tempfile.TemporaryDirectory() as path:
+                os.makedirs(os.path.join(path, "request"))
+                schema_path = os.path.join(path, "request", "eval.json")
 
-        self.assertEqual(
-            e.exception.error_thrown["message"],  # type: ignore
-            "None should not be valid under {'type': 'null'}",
-        )
+                with open(schema_path, "w") as f:
+                    f.write(schema)
 
-    def test_bad_params(self):
-        body = {"response": "example", "answer": "example", "params": 2}
+                with self.use_schema_dir(path):
+                    validate.load_all_validators()
 
-        with self.assertRaises(ValidationError) as e:
-            validate.body(body, ReqBodyValidators.EVALUATION)
+                    with self.assertRaises(ValidationError) as e:
+                        validate.body({}, ReqBodyValidators.EVALUATION)
 
-        self.assertEqual(
-            e.exception.error_thrown["message"],  # type: ignore
-            "2 is not of type 'object'",
-        )
+                self.assertEqual(e.exception.message, INVALID_EVAL_MESSAGE)
 
-    def test_extra_fields(self):
-        body = {
-            "response": "example",
-            "answer": "example",
-            "params": {},
-            "hello": "world",
-        }
+    def test_other_errors_propagate(self):
+        with mock.patch.object(
+            validate, "load_fast_validator", side_effect=KeyError("bug")
+        ):
+            with self.assertRaises(KeyError):
+                validate.body({}, ReqBodyValidators.EVALUATION)
 
-        with self.assertRaises(ValidationError) as e:
-            validate.body(body, ReqBodyValidators.EVALUATION)
+    def test_load_all_validators_skips_unreadable_schemas(self):
+        with mock.patch.object(
+            validate, "load_validator", side_effect=IsADirectoryError()
+        ):
+            validate.load_all_validators()
 
-        self.assertEqual(
-            e.exception.error_thrown["message"],  # type: ignore
-            "Additional properties are not allowed ('hello' was unexpected)",
-        )
+    def test_validator_is_cached(self):
+        first = validate.load_validator(ReqBodyValidators.EVALUATION)
+        second = validate.load_validator(ReqBodyValidators.EVALUATION)
 
-    def test_valid_request_body(self):
-        body = {"response": "", "answer": ""}
-        validate.body(body, ReqBodyValidators.EVALUATION)
+        self.assertIs(first, second)
 
 
 if __name__ == "__main__":
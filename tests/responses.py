@@ -2,6 +2,7 @@ import unittest
 
 from ..tools import validate
 from ..tools.validate import ResBodyValidators, ValidationError
+from ._fixtures import INVALID_EVAL_MESSAGE
 
 
 class TestResponseValidation(unittest.TestCase):
@@ -11,10 +12,7 @@ class TestResponseValidation(unittest.TestCase):
         with self.assertRaises(ValidationError) as e:
             validate.body(body, ResBodyValidators.EVALUATION)
 
-        self.assertEqual(
-            str(e.exception.message),
-            "Failed to validate body against the evaluation schema.",
-        )
+        self.assertEqual(str(e.exception.message), INVALID_EVAL_MESSAGE)
 
     def test_extra_fields(self):
         body = {
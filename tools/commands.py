@@ -1,4 +1,8 @@
+import copy
+import json
+import os
 import warnings
+from collections import OrderedDict
 from typing import Any, Dict, List, NamedTuple, Optional, Tuple, TypedDict
 
 from evaluation_function_utils.errors import EvaluationException
@@ -6,10 +10,13 @@ from evaluation_function_utils.errors import EvaluationException
 from . import healthcheck as health
 from . import parse, validate
 from .utils import (
+    EMPTY_MAPPING,
+    BatchEvaluationFunctionType,
     EvaluationFunctionType,
     JsonType,
     PreviewFunctionType,
     Response,
+    error_detail,
 )
 from .validate import ReqBodyValidators
 
@@ -24,6 +31,13 @@ except ImportError:
         "`commands.evaluate()` will raise an exception."
     )
 
+try:
+    from ..evaluation import evaluation_function_batch  # type: ignore
+
+except ImportError:
+    # Optional, evaluates all cases in a single call if defined.
+    evaluation_function_batch: Optional[BatchEvaluationFunctionType] = None
+
 try:
     from ..preview import preview_function  # type: ignore
 
@@ -44,6 +58,18 @@ except ImportError:
     )
 
 
+CASE_CACHE_SIZE = 256
+
+# Evaluation functions that aren't pure (e.g. randomised or time dependent)
+# can turn the result cache off by setting SKIP_EVALUATION_CACHE=1.
+SKIP_EVALUATION_CACHE = os.getenv("SKIP_EVALUATION_CACHE") == "1"
+
+# Results of evaluating cases, keyed by the evaluation function and the
+# canonical JSON form of its arguments. Lives for the lifetime of the
+# container, so it is only reset on a cold start.
+_case_cache: "OrderedDict[Tuple[Any, str], JsonType]" = OrderedDict()
+
+
 class CaseWarning(TypedDict, total=False):
     """Dictionary for reporting issues when testing cases"""
 
@@ -122,17 +148,25 @@ def evaluate(event: JsonType) -> Response:
     body = parse.body(event)
     validate.body(body, ReqBodyValidators.EVALUATION)
 
+    response, answer = body["response"], body["answer"]
     params = body.get("params", {})
 
     if evaluation_function is None:
         raise EvaluationException("Evaluation function is not defined.")
 
-    result = evaluation_function(body["response"], body["answer"], params)
+    cases = params.get("cases")
 
-    if result["is_correct"] is False and "cases" in params and len(params["cases"]) > 0:
-        match, warnings = get_case_feedback(
-            body["response"], params, params["cases"]
-        )
+    # Most requests don't include any cases.
+    if not cases:
+        result = evaluation_function(response, answer, params)
+        return Response(command="eval", result=result)
+
+    # Cache the result so a case with the same answer and params as the
+    # task reuses it. It's copied since the case feedback is added below.
+    result = dict(cached_evaluation(response, answer, params))
+
+    if not result["is_correct"]:
+        match, warnings = get_case_feedback(response, params, cases)
 
         if warnings:
             result["warnings"] = warnings
@@ -158,7 +192,9 @@ def get_case_feedback(
 
     Args:
         response (Any): The student response.
-        params (Dict): The evaluation function params.
+        params (Dict): The evaluation function params. If
+        `return_first_match` is set to False, all cases are evaluated and a
+        warning is given when more than one matches.
         cases (List[Dict]): The list of potential cases to check against.
         Must contain a feedback and answer field. May optionally contain
         a mark field to override the is_correct response from the
@@ -170,10 +206,22 @@ def get_case_feedback(
         issues encountered when evaluating each case against the student's
         response.
     """
-    # NOTE: Previous behaviour, where all cases are evaluated but only the feedback
-    # for the first case is returned can be restored by changing the line below to:
-    # matches, feedback, warnings = evaluate_all_cases(response, params, cases)
-    matches, feedback, warnings = find_first_matching_case(response, params, cases)
+    # Stop at the first matching case by default, since only its feedback is
+    # returned. Evaluating all cases is only needed to warn about other matches.
+    first_only = params.get("return_first_match", True)
+
+    if evaluation_function_batch is not None:
+        matches, feedback, warnings = evaluate_cases_batch(
+            response, params, cases, first_only
+        )
+    elif first_only:
+        matches, feedback, warnings = find_first_matching_case(
+            response, params, cases
+        )
+    else:
+        matches, feedback, warnings = evaluate_all_cases(
+            response, params, cases
+        )
 
     if not matches:
         return None, warnings
@@ -183,7 +231,8 @@ def get_case_feedback(
     match = cases[match_id]
     match["id"] = match_id
 
-    match_params = match.get("params", {})
+    # Cases may omit their params or set them to null.
+    match_params = match.get("params") or EMPTY_MAPPING
 
     if match_params.get("override_eval_feedback", False):
         match_feedback = match.get("feedback", "")
@@ -201,6 +250,7 @@ def get_case_feedback(
 
     return match, warnings
 
+
 def find_first_matching_case(
     response: Any,
     params: Dict,
@@ -219,9 +269,10 @@ def find_first_matching_case(
         strings from each case, and a list of issues encountered when
         evaluating cases against the student's response.
     """
-    matches, feedback, warnings = [], [], []
+    matches, feedback = [], []
+    valid_cases, warnings = split_cases(cases)
 
-    for index, case in enumerate(cases):
+    for index, case in valid_cases:
         result = evaluate_case(response, params, case, index)
 
         if result.warning is not None:
@@ -234,6 +285,7 @@ def find_first_matching_case(
 
     return matches, feedback, warnings
 
+
 def evaluate_all_cases(
     response: Any,
     params: Dict,
@@ -252,9 +304,10 @@ def evaluate_all_cases(
         strings from each case, and a list of issues encountered when
         evaluating cases against the student's response.
     """
-    matches, feedback, warnings = [], [], []
+    matches, feedback = [], []
+    valid_cases, warnings = split_cases(cases)
 
-    for index, case in enumerate(cases):
+    for index, case in valid_cases:
         result = evaluate_case(response, params, case, index)
 
         if result.warning is not None:
@@ -267,6 +320,137 @@ def evaluate_all_cases(
     return matches, feedback, warnings
 
 
+def evaluate_cases_batch(
+    response: Any,
+    params: Dict,
+    cases: List[Dict],
+    first_only: bool = True,
+) -> Tuple[List[int], List[str], List[CaseWarning]]:
+    """Evaluates all valid cases in one call to the batch evaluation function.
+
+    Args:
+        response (Any): The student's response.
+        params (Dict): The params of the evaluation function.
+        cases (List[Dict]): A list of cases to check against.
+        first_only (bool): Whether to only report the first matching case.
+        Defaults to True.
+
+    Returns:
+        Tuple[List[int], List[str], List[CaseWarning]]: Returns a list of
+        indices of cases that match a student's response, a list of feedback
+        strings from each case, and a list of issues encountered when
+        evaluating cases against the student's response.
+    """
+    matches, feedback = [], []
+    valid_cases, warnings = split_cases(cases)
+
+    indices = [index for index, _ in valid_cases]
+    batch = [
+        (case["answer"], merge_case_params(params, case))
+        for _, case in valid_cases
+    ]
+
+    if not batch:
+        return matches, feedback, warnings
+
+    try:
+        results = list(
+            evaluation_function_batch(response, batch)  # type: ignore
+        )
+
+    # Catch exceptions and save as a warning.
+    except EvaluationException as e:
+        warnings.append(CaseWarning(**e.error_dict))
+        return matches, feedback, warnings
+
+    except Exception as e:
+        warnings.append(
+            CaseWarning(
+                message="An exception was raised while "
+                "executing the evaluation function.",
+                detail=error_detail(e),
+            )
+        )
+        return matches, feedback, warnings
+
+    # Results can't be matched to their cases if any are missing.
+    if len(results) != len(batch):
+        warnings.append(
+            CaseWarning(
+                message="The batch evaluation function returned "
+                f"{len(results)} results for {len(batch)} cases."
+            )
+        )
+        return matches, feedback, warnings
+
+    for index, result in zip(indices, results):
+        # Guard each result, like `evaluate_case` does for a single case.
+        try:
+            is_correct = result["is_correct"]
+            case_feedback = result.get("feedback", "")
+        except Exception as e:
+            warning = CaseWarning(
+                case=index,
+                message="An exception was raised while "
+                "executing the evaluation function.",
+                detail=error_detail(e),
+            )
+            warnings.append(warning)
+            continue
+
+        if is_correct:
+            matches.append(index)
+            feedback.append(case_feedback)
+
+            if first_only:
+                break
+
+    return matches, feedback, warnings
+
+
+def split_cases(
+    cases: List[Dict],
+) -> Tuple[List[Tuple[int, Dict]], List[CaseWarning]]:
+    """Separate the cases that can be evaluated from the malformed ones.
+
+    Args:
+        cases (List[Dict]): A list of cases to check against.
+
+    Returns:
+        Tuple[List[Tuple[int, Dict]], List[CaseWarning]]: The index and
+        content of each case with an answer and feedback field, and a warning
+        for each case missing either of them.
+    """
+    valid_cases, warnings = [], []
+
+    for index, case in enumerate(cases):
+        if "answer" in case and "feedback" in case:
+            valid_cases.append((index, case))
+        else:
+            warning = CaseWarning(
+                case=index, message="Missing answer/feedback field"
+            )
+            warnings.append(warning)
+
+    return valid_cases, warnings
+
+
+def merge_case_params(params: Dict, case: Dict) -> Dict:
+    """Merge the evaluation function params with any specified in a case.
+
+    Args:
+        params (Dict): The params of the evaluation function.
+        case (Dict): The case, which may contain a params field.
+
+    Returns:
+        Dict: The combined params, where the case params take precedence.
+    """
+    case_params = case.get("params")
+
+    # Most cases don't override any params, so the copy can be skipped.
+    return {**params, **case_params} if case_params else params
+
+
 def evaluate_case(
     response: Any,
     params: Dict,
@@ -279,8 +463,8 @@ def evaluate_case(
         response (Any): The student's response.
         params (Dict): The params of the evaluation function.
         case (Dict): The case to evaluate. Must contain a feedback and answer
-        field. May optionally contain a mark field to override the is_correct
-        result.
+        field (see `split_cases`). May optionally contain a mark field to
+        override the is_correct result.
         index (int): The index of the case in the list of cases (as an id).
 
     Returns:
@@ -288,21 +472,10 @@ def evaluate_case(
         correct, the feedback associated and the warning encountered
         (if any, else None).
     """
-    if "answer" not in case or "feedback" not in case:
-        warning = CaseWarning(
-            case=index, message="Missing answer/feedback field"
-        )
-
-        return CaseResult(warning=warning)
-
-    # Merge current evaluation params with any specified in case
-    case_params = case.get("params", {})
-    combined_params = {**params, **case_params}
+    combined_params = merge_case_params(params, case)
 
     try:
-        result = evaluation_function(
-            response, case["answer"], combined_params
-        )  # type: ignore
+        result = cached_evaluation(response, case["answer"], combined_params)
 
         return CaseResult(
             is_correct=result["is_correct"],
@@ -318,7 +491,56 @@ def evaluate_case(
             case=index,
             message="An exception was raised while "
             "executing the evaluation function.",
-            detail=(str(e) if str(e) != "" else repr(e)),
+            detail=error_detail(e),
         )
 
     return CaseResult(warning=warning)
+
+
+def cached_evaluation(response: Any, answer: Any, params: Dict) -> JsonType:
+    """Call the evaluation function, reusing results for repeated arguments.
+
+    Note:
+        Evaluation functions are assumed to be pure, so a case that was
+        already evaluated against an identical response and params (e.g. a
+        student resubmitting the same answer) is served from a bounded LRU
+        cache. Arguments that have no canonical JSON form bypass the cache.
+        The cases in the params are left out of the key, since they're used
+        by this layer rather than the evaluation function, and serialising
+        every case for every call would make a request quadratic in its
+        number of cases. Results are copied into and out of the cache, so
+        changes to a returned result never reach later requests. Setting
+        SKIP_EVALUATION_CACHE=1 always calls the evaluation function.
+
+    Args:
+        response (Any): The student's response.
+        answer (Any): The answer to evaluate the response against.
+        params (Dict): The params of the evaluation function.
+
+    Returns:
+        JsonType: The result returned by the evaluation function.
+    """
+    if SKIP_EVALUATION_CACHE:
+        return evaluation_function(response, answer, params)  # type: ignore
+
+    key_params = {k: v for k, v in params.items() if k != "cases"}
+
+    try:
+        key = (
+            evaluation_function,
+            json.dumps([response, answer, key_params], sort_keys=True),
+        )
+    except (TypeError, ValueError):
+        return evaluation_function(response, answer, params)  # type: ignore
+
+    if key in _case_cache:
+        _case_cache.move_to_end(key)
+        return copy.deepcopy(_case_cache[key])
+
+    result = evaluation_function(response, answer, params)  # type: ignore
+
+    _case_cache[key] = copy.deepcopy(result)
+    if len(_case_cache) > CASE_CACHE_SIZE:
+        _case_cache.popitem(last=False)
+
+    return result
@@ -1,8 +1,13 @@
 import base64
+import functools
 import os
+import stat
 
 from .utils import DocsResponse
 
+# Shared by every docs response, so it must never be mutated.
+OCTET_STREAM_HEADERS = {"Content-Type": "application/octet-stream"}
+
 
 def send_file(filepath: str) -> DocsResponse:
     """Create a response object for receiving a file.
@@ -13,23 +18,43 @@ def send_file(filepath: str) -> DocsResponse:
     Returns:
         DocsResponse: The response object the handler should return.
     """
-    if not os.path.isfile(filepath):
+    try:
+        file_stat = os.stat(filepath)
+    except OSError:
+        file_stat = None
+
+    if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
         return DocsResponse(
             statusCode=200,
             body=f"{filepath} missing from evaluation function files",
-            headers={"Content-Type": "application/octet-stream"},
+            headers=OCTET_STREAM_HEADERS,
             isBase64Encoded=False,
         )
 
+    return encode_file(filepath, file_stat.st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def encode_file(filepath: str, mtime_ns: int) -> DocsResponse:
+    """Read and encode a file, caching the response until it is modified.
+
+    Args:
+        filepath (str): The path of the file to send.
+        mtime_ns (int): The modification time of the file, so that the cached
+        response is replaced when the file changes.
+
+    Returns:
+        DocsResponse: The response object the handler should return.
+    """
     with open(filepath, "rb") as file:
         docs_file = file.read()
 
-    docs_encoded = base64.encodebytes(docs_file)
+    docs_encoded = base64.b64encode(docs_file)
 
     return DocsResponse(
         statusCode=200,
-        body=docs_encoded.decode(),
-        headers={"Content-Type": "application/octet-stream"},
+        body=docs_encoded.decode("ascii"),
+        headers=OCTET_STREAM_HEADERS,
         isBase64Encoded=True,
     )
 
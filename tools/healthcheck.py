@@ -1,9 +1,8 @@
 import os
-import re
 import sys
 import time
 import unittest
-from typing import Any, List, TypedDict
+from typing import Any, List, Optional, Tuple, TypedDict
 
 from typing_extensions import NotRequired
 
@@ -19,6 +18,9 @@ try:
 except ImportError:
     TestPreviewFunction = None
 
+# Stream for discarding unittest output, opened once per process.
+NULL_STREAM = open(os.devnull, "w")
+
 
 class JsonTestResult(TypedDict):
     """JSON-serialisable result of a single unit test."""
@@ -45,32 +47,36 @@ class HealthcheckResult(unittest.TextTestResult):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
-        self.__path_re = re.compile(r"^[\.\/\w]+\.(\w+\.\w+)$")
-
         self.__successes_json: JsonTestResults = []
         self.__failures_json: JsonTestResults = []
         self.__errors_json: JsonTestResults = []
 
     def get_name_from_id(self, path: str) -> str:
         """Remove the full path of the unit test, keeping only its name."""
-        path_match = self.__path_re.match(path)
-
-        if path_match is None:
+        # Test ids are module path, class and method joined with dots.
+        parts = path.rsplit(".", 2)
+
+        # Other ids (e.g. "setUpClass (module.Class)" for a failing class
+        # fixture, or subtests) aren't reported by name.
+        if len(parts) < 3 or not all(
+            part.isidentifier()
+            for part in (*parts[0].replace("/", ".").split("."), *parts[1:])
+        ):
             return "Unknown"
 
-        return path_match.group(1)
+        return f"{parts[1]}.{parts[2]}"
 
     def startTest(self, test: unittest.TestCase) -> None:
-        self._start_time = time.time()
+        self._start_time = time.perf_counter_ns()
         super().startTest(test)
 
     def addSuccess(self, test: unittest.TestCase) -> None:
-        elapsed = time.time() - self._start_time
+        elapsed_us = (time.perf_counter_ns() - self._start_time) // 1000
 
         self.__successes_json.append(
             JsonTestResult(
                 name=self.get_name_from_id(test.id()),
-                time=round(1e6 * elapsed),
+                time=elapsed_us,
             )
         )
 
@@ -117,6 +123,29 @@ class HealthcheckRunner(unittest.TextTestRunner):
         )
 
 
+def load_test_names(*cases: Optional[type]) -> List[Tuple[type, List[str]]]:
+    """Collect the names of the unit tests defined by each test case.
+
+    Args:
+        *cases (Optional[type]): The test case classes, undefined test cases
+        (i.e. evaluation and preview if deleted) are skipped.
+
+    Returns:
+        List[Tuple[type, List[str]]]: Each test case with its test names.
+    """
+    loader = unittest.TestLoader()
+
+    return [(c, loader.getTestCaseNames(c)) for c in cases if c is not None]
+
+
+# The tests don't change within a deployment, so they're only collected once.
+TEST_CASES = load_test_names(
+    SmokeTests,
+    TestEvaluationFunction,
+    TestPreviewFunction,
+)
+
+
 def healthcheck() -> HealthcheckJsonTestResult:
     """Get the result of a healthcheck by running all unit tests.
 
@@ -125,28 +154,17 @@ def healthcheck() -> HealthcheckJsonTestResult:
         healthcheck command function.
     """
     # Redirect stderr stream to null to prevent logging unittest results
-    no_stream = open(os.devnull, "w")
-    sys.stderr = no_stream
-
-    # Create a test loader and test runner instance
-    loader = unittest.TestLoader()
-
-    cases = (
-        SmokeTests,
-        TestEvaluationFunction,
-        TestPreviewFunction,
-    )
+    sys.stderr = NULL_STREAM
 
-    # Filter undefined test cases (i.e. evaluation and preview if deleted.)
-    tests = [loader.loadTestsFromTestCase(c) for c in cases if c is not None]
+    # A suite discards its tests once run, so new instances are made each time
+    tests = (unittest.TestSuite(map(c, names)) for c, names in TEST_CASES)
 
     suite = unittest.TestSuite(tests)
     runner = HealthcheckRunner(verbosity=0)
 
     result = runner.run(suite)
 
-    # Reset stderr and close the null stream
+    # Reset stderr, the null stream is kept open for the next healthcheck
     sys.stderr = sys.__stderr__
-    no_stream.close()
 
     return result
@@ -1,7 +1,15 @@
 import json
 from typing import Dict, Literal, Optional, TypedDict, Union
 
-from .utils import JsonType
+from .utils import HandlerInputError, JsonType
+
+try:
+    import orjson
+
+    fast_loads = orjson.loads
+
+except ImportError:
+    fast_loads = json.loads
 
 
 class DecodeErrorDetail(TypedDict):
@@ -9,7 +17,7 @@ class DecodeErrorDetail(TypedDict):
     location: Dict[Literal["line", "column"], int]
 
 
-class ParseError(Exception):
+class ParseError(HandlerInputError):
     """Custom exception for all parsing issues."""
 
     def __init__(
@@ -18,9 +26,7 @@ class ParseError(Exception):
         error_thrown: Optional[Union[str, DecodeErrorDetail]] = None,
         *args,
     ) -> None:
-        super().__init__(*args)
-        self.message = message
-        self.error_thrown = error_thrown
+        super().__init__(message, error_thrown, *args)
 
 
 def body(event: JsonType) -> JsonType:
@@ -40,10 +46,26 @@ def body(event: JsonType) -> JsonType:
 
     if body is None:
         raise ParseError("No data supplied in request body.")
-    elif type(body) is dict:
+    elif isinstance(body, dict):
         return body
+    elif not isinstance(body, (str, bytes, bytearray, memoryview)):
+        raise ParseError(
+            "Request body is not valid JSON.",
+            f"Expected a JSON string or object, got {type(body).__name__}.",
+        )
 
     # If it does, convert the body into a dictionary.
+    try:
+        return fast_loads(body)
+    except (TypeError, ValueError):
+        pass
+
+    # Unlike orjson, the standard library doesn't accept memoryviews.
+    if isinstance(body, memoryview):
+        body = body.tobytes()
+
+    # Decode again using the standard library, which either accepts the body
+    # (e.g. NaN literals) or reports the issue in the expected format.
     try:
         return json.loads(body)
     # Catch Decode errors and return the problems back to the requester.
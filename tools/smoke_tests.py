@@ -64,35 +64,27 @@ class SmokeTests(unittest.TestCase):
         self.assertTrue(result["isBase64Encoded"])
 
     def test_load_eval_req_schema(self):
-        schema = validate.load_validator_from_url(
-            validate.ReqBodyValidators.EVALUATION
-        )
+        schema = validate.load_validator(validate.ReqBodyValidators.EVALUATION)
 
         self.assertIsInstance(schema, jsonschema.Draft7Validator)
 
     def test_load_preview_req_schema(self):
-        schema = validate.load_validator_from_url(
-            validate.ReqBodyValidators.PREVIEW
-        )
+        schema = validate.load_validator(validate.ReqBodyValidators.PREVIEW)
 
         self.assertIsInstance(schema, jsonschema.Draft7Validator)
 
     def test_load_eval_res_schema(self):
-        schema = validate.load_validator_from_url(
-            validate.ResBodyValidators.EVALUATION
-        )
+        schema = validate.load_validator(validate.ResBodyValidators.EVALUATION)
 
         self.assertIsInstance(schema, jsonschema.Draft7Validator)
 
     def test_load_preview_res_schema(self):
-        schema = validate.load_validator_from_url(
-            validate.ResBodyValidators.PREVIEW
-        )
+        schema = validate.load_validator(validate.ResBodyValidators.PREVIEW)
 
         self.assertIsInstance(schema, jsonschema.Draft7Validator)
 
     def test_load_health_res_schema(self):
-        schema = validate.load_validator_from_url(
+        schema = validate.load_validator(
             validate.ResBodyValidators.HEALTHCHECK
         )
 
@@ -1,6 +1,17 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, Literal, TypedDict, Union
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    Tuple,
+    TypedDict,
+    Union,
+)
 
 from typing_extensions import NotRequired
 
@@ -9,6 +20,26 @@ SupportedCommands = Literal["eval", "grade", "preview", "healthcheck"]
 
 EvaluationFunctionType = Callable[[Any, Any, JsonType], JsonType]
 PreviewFunctionType = Callable[[Any, JsonType], JsonType]
+BatchEvaluationFunctionType = Callable[
+    [Any, List[Tuple[Any, JsonType]]], List[JsonType]
+]
+
+# Shared read-only default for optional fields that are only read from.
+EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+
+class HandlerInputError(Exception):
+    """Base exception for issues with the request received by the handler.
+
+    The message and detail are returned to the requester in the error
+    response.
+    """
+
+    def __init__(self, message: str, error_thrown: Any = None, *args) -> None:
+        super().__init__(*args)
+
+        self.message = message
+        self.error_thrown = error_thrown
 
 
 class ErrorResponse(TypedDict):
@@ -36,3 +67,9 @@ class DocsResponse(TypedDict):
 
 
 HandlerResponse = Union[Response, DocsResponse]
+
+
+def error_detail(e: BaseException) -> str:
+    """Get the detail of an exception, falling back to its repr if empty."""
+    detail = str(e)
+    return detail if detail else repr(e)
@@ -1,12 +1,18 @@
 import enum
 import functools
 import os
-from typing import Dict, List, TypedDict, Union
+from typing import Any, Callable, Dict, List, Optional, TypedDict, Union
 
 import dotenv
 import jsonschema
-import jsonschema.exceptions
-import json
+
+from .parse import fast_loads
+from .utils import HandlerInputError
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
 
 dotenv.load_dotenv()
 
@@ -19,16 +25,13 @@ class SchemaErrorThrown(TypedDict):
     instance_path: List[Union[str, int]]
 
 
-class ValidationError(Exception):
+class ValidationError(HandlerInputError):
     """Generic exception for all validation issues."""
 
     def __init__(
         self, message: str, error_thrown: Union[str, SchemaErrorThrown], *args
     ) -> None:
-        super().__init__(*args)
-
-        self.message = message
-        self.error_thrown = error_thrown
+        super().__init__(message, error_thrown, *args)
 
 
 """Enumeration objects for picking which schema to validate against."""
@@ -53,19 +56,31 @@ class ResBodyValidators(enum.Enum):
 
 BodyValidators = Union[ReqBodyValidators, ResBodyValidators]
 
-def load_validator(
-    validator_enum: BodyValidators,
-) -> jsonschema.Draft7Validator:
-    """Loads a json schema for body validations.
+# Raised when a schema can't be loaded, or is broken (e.g. it isn't an object
+# or uses an unknown type). Any other error is treated as a bug.
+SCHEMA_ERRORS = (
+    OSError,
+    RuntimeError,
+    ValueError,
+    TypeError,
+    AttributeError,
+    jsonschema.SchemaError,
+    jsonschema.exceptions.UnknownType,
+)
+
+
+@functools.lru_cache(maxsize=None)
+def load_schema(validator_enum: BodyValidators) -> Dict:
+    """Loads a json schema from the schema directory.
 
     Args:
         validator_enum (BodyValidators): The validator enum name.
 
     Raises:
-        ValueError: Raised if the schema repo URL cannot be found.
+        RuntimeError: Raised if the schema directory or file cannot be found.
 
     Returns:
-        Draft7Validator: The validator to use.
+        Dict: The schema.
     """
     schema_dir = os.getenv("SCHEMA_DIR")
     if schema_dir is None:
@@ -74,12 +89,67 @@ def load_validator(
     schema_path = os.path.join(schema_dir,validator_enum.value)
 
     try:
-        with open(schema_path, "r") as f:
-            schema = json.load(f)
+        with open(schema_path, "rb") as f:
+            return fast_loads(f.read())
     except FileNotFoundError as e:
-        raise RuntimeError(f"Could not find schema for {validator_enum}") from e
+        raise RuntimeError(
+            f"Could not find schema for {validator_enum}"
+        ) from e
+
+
+@functools.lru_cache(maxsize=None)
+def load_validator(
+    validator_enum: BodyValidators,
+) -> jsonschema.Draft7Validator:
+    """Loads a json schema for body validations.
+
+    Note:
+        Validators are cached per enum member, so each schema is only read
+        from disk and compiled once per container (i.e. on cold start).
+
+    Args:
+        validator_enum (BodyValidators): The validator enum name.
+
+    Raises:
+        RuntimeError: Raised if the schema directory or file cannot be found.
+
+    Returns:
+        Draft7Validator: The validator to use.
+    """
+    return jsonschema.Draft7Validator(load_schema(validator_enum))
+
+
+@functools.lru_cache(maxsize=None)
+def load_fast_validator(
+    validator_enum: BodyValidators,
+) -> Optional[Callable[[Any], Any]]:
+    """Compiles a json schema to a fastjsonschema validation function.
 
-    return jsonschema.Draft7Validator(schema)
+    Note:
+        The compiled function only decides whether a body is valid. Error
+        details are still produced by the jsonschema validator, so they are
+        the same whether or not fastjsonschema is installed.
+
+    Args:
+        validator_enum (BodyValidators): The validator enum name.
+
+    Raises:
+        RuntimeError: Raised if the schema directory or file cannot be found.
+
+    Returns:
+        Optional[Callable[[Any], Any]]: The validation function, or None if
+        fastjsonschema isn't installed or can't compile the schema.
+    """
+    if fastjsonschema is None:
+        return None
+
+    schema = load_schema(validator_enum)
+
+    try:
+        # Defaults are disabled, so the body is never modified.
+        return fastjsonschema.compile(schema, use_default=False)
+    except fastjsonschema.JsonSchemaDefinitionException:
+        return None
 
 
 def body(body: Dict, validator_enum: BodyValidators) -> None:
@@ -94,18 +164,29 @@ def body(body: Dict, validator_enum: BodyValidators) -> None:
         be obtained.
     """
     try:
+        fast_validator = load_fast_validator(validator_enum)
+
+        if fast_validator is not None:
+            try:
+                fast_validator(body)
+                return
+            except fastjsonschema.JsonSchemaException:
+                # Validate again below to report the issue in detail.
+                pass
+
+        # Take the first error like validate() does, without raising it.
         validator = load_validator(validator_enum)
-        validator.validate(body)
+        error = next(validator.iter_errors(body), None)
 
-        return
+        if error is None:
+            return
 
-    except jsonschema.exceptions.ValidationError as e:
         error_thrown = SchemaErrorThrown(
-            message=e.message,
-            schema_path=list(e.absolute_schema_path),
-            instance_path=list(e.absolute_path),
+            message=error.message,
+            schema_path=list(error.absolute_schema_path),
+            instance_path=list(error.absolute_path),
         )
-    except Exception as e:
+    except SCHEMA_ERRORS as e:
         error_thrown = str(e)
 
     raise ValidationError(
@@ -113,3 +194,24 @@ def body(body: Dict, validator_enum: BodyValidators) -> None:
         f"{validator_enum.name.lower()} schema.",
         error_thrown,
     )
+
+
+def load_all_validators() -> None:
+    """Compile the validator of every schema ahead of the first request.
+
+    Note:
+        Schemas that fail to load are skipped here, the issue is reported
+        by `body()` when a request is validated against them.
+    """
+    for validator_enum in (*ReqBodyValidators, *ResBodyValidators):
+        try:
+            load_validator(validator_enum)
+            load_fast_validator(validator_enum)
+        except SCHEMA_ERRORS:
+            pass
+
+
+# Compile validators during the Lambda init phase (cold start), so that warm
+# requests only run the validation itself.
+if os.getenv("SCHEMA_DIR") is not None:
+    load_all_validators()